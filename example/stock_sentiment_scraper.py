@@ -11,10 +11,13 @@ Usage:
 """
 
 import json
+import logging
 import os
 import sys
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add src to path
@@ -24,8 +27,16 @@ src_path = os.path.join(project_root, "src")
 sys.path.append(src_path)
 
 from yars.yars import YARS
+from yars.agents import get_agent
 from yars.utils import display_results
 
+try:
+    import orjson  # optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("stock_sentiment")
+
 
 class StockSentimentScraper:
     """Scraper specifically designed for stock market sentiment analysis"""
@@ -41,13 +52,29 @@ class StockSentimentScraper:
         self.proxy = proxy
         self.verbose = verbose
 
+        # Verbose mode prints progress to the console, as it always has,
+        # whether or not the embedding application configured logging
+        if verbose and not logger.handlers:
+            console = logging.StreamHandler()
+            console.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(console)
+            logger.setLevel(logging.INFO)
+
         if proxy:
-            self.log(f"✓ Using proxy: {proxy[:30]}...")
+            self.log("✓ Using proxy: %s...", proxy[:30])
         else:
             self.log("⚠ WARNING: No proxy configured! Reddit may ban your IP.")
             self.log("  Set REDDIT_PROXY environment variable or pass proxy parameter")
 
-        self.miner = YARS(proxy=proxy, timeout=15, random_user_agent=True)
+        self.miner = YARS(proxy=proxy, timeout=15, random_user_agent=False)
+
+        # Pick one user agent per session instead of rewriting the shared
+        # session headers on every request from every worker thread
+        self.miner.session.headers["User-Agent"] = get_agent()
+
+        # Request pacing shared by every worker thread
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
 
         # Stock-focused subreddits
         self.stock_subreddits = [
@@ -58,10 +85,18 @@ class StockSentimentScraper:
             "options"
         ]
 
-    def log(self, message):
-        """Print message if verbose mode is on"""
+    def log(self, message, *args):
+        """Log message if verbose mode is on (args are formatted lazily)"""
         if self.verbose:
-            print(message)
+            logger.info(message, *args)
+
+    def _throttle(self):
+        """Wait for the next request slot (2-4s apart across all threads)"""
+        with self._throttle_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + random.uniform(2, 4)
+        time.sleep(start - now)
 
     def scrape_ticker_sentiment(self, ticker, max_posts=30):
         """
@@ -74,9 +109,9 @@ class StockSentimentScraper:
         Returns:
             Dictionary containing scraped posts and metadata
         """
-        self.log(f"\n{'='*60}")
-        self.log(f"Scraping sentiment for: {ticker}")
-        self.log(f"{'='*60}")
+        self.log("\n%s", '='*60)
+        self.log("Scraping sentiment for: %s", ticker)
+        self.log("%s", '='*60)
 
         results = {
             "ticker": ticker,
@@ -87,9 +122,12 @@ class StockSentimentScraper:
         }
 
         for subreddit in self.stock_subreddits:
-            self.log(f"\nSearching r/{subreddit}...")
+            self.log("\nSearching r/%s for %s...", subreddit, ticker)
 
             try:
+                # Rate limiting - be respectful to Reddit
+                self._throttle()
+
                 # Search within subreddit for the ticker
                 posts = self.miner.search_subreddit(
                     subreddit,
@@ -99,25 +137,20 @@ class StockSentimentScraper:
                 )
 
                 if posts:
+                    # Tag posts in place; they are fresh dicts from YARS
+                    for post in posts:
+                        post["subreddit"] = subreddit
+                        post["ticker"] = ticker
+
                     results["by_subreddit"][subreddit] = len(posts)
                     results["total_posts"] += len(posts)
-                    results["all_posts"].extend([
-                        {
-                            **post,
-                            "subreddit": subreddit,
-                            "ticker": ticker
-                        }
-                        for post in posts
-                    ])
-                    self.log(f"  ✓ Found {len(posts)} posts")
+                    results["all_posts"].extend(posts)
+                    self.log("  ✓ r/%s: found %d %s posts", subreddit, len(posts), ticker)
                 else:
-                    self.log(f"  - No posts found")
-
-                # Rate limiting - be respectful to Reddit
-                time.sleep(random.uniform(2, 4))
+                    self.log("  - r/%s: no %s posts found", subreddit, ticker)
 
             except Exception as e:
-                self.log(f"  ✗ Error: {e}")
+                self.log("  ✗ Error: %s", e)
                 continue
 
         return results
@@ -138,12 +171,19 @@ class StockSentimentScraper:
             "tickers": {}
         }
 
-        for ticker in tickers:
-            ticker_data = self.scrape_ticker_sentiment(ticker, max_posts_per_ticker)
-            all_results["tickers"][ticker] = ticker_data
+        if not tickers:
+            return all_results
+
+        # Tickers are scraped concurrently; _throttle() keeps the combined
+        # request rate the same as a serial run
+        with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+            ticker_data = executor.map(
+                lambda ticker: self.scrape_ticker_sentiment(ticker, max_posts_per_ticker),
+                tickers
+            )
 
-            # Extra delay between tickers
-            time.sleep(random.uniform(3, 6))
+            for ticker, data in zip(tickers, ticker_data):
+                all_results["tickers"][ticker] = data
 
         return all_results
 
@@ -158,7 +198,7 @@ class StockSentimentScraper:
         Returns:
             List of post data
         """
-        self.log(f"\nFetching hot posts from r/{subreddit}...")
+        self.log("\nFetching hot posts from r/%s...", subreddit)
 
         try:
             posts = self.miner.fetch_subreddit_posts(
@@ -167,10 +207,10 @@ class StockSentimentScraper:
                 category="hot",
                 time_filter="day"
             )
-            self.log(f"✓ Retrieved {len(posts)} hot posts")
+            self.log("✓ Retrieved %d hot posts", len(posts))
             return posts
         except Exception as e:
-            self.log(f"✗ Error: {e}")
+            self.log("✗ Error: %s", e)
             return []
 
     def get_post_details_with_comments(self, permalink):
@@ -183,26 +223,33 @@ class StockSentimentScraper:
         Returns:
             Dictionary with post title, body, and all comments
         """
-        self.log(f"\nFetching detailed post data...")
+        self.log("\nFetching detailed post data...")
 
         try:
             details = self.miner.scrape_post_details(permalink)
             if details:
                 num_comments = len(details.get('comments', []))
-                self.log(f"✓ Retrieved post with {num_comments} comments")
+                self.log("✓ Retrieved post with %d comments", num_comments)
             return details
         except Exception as e:
-            self.log(f"✗ Error: {e}")
+            self.log("✗ Error: %s", e)
             return None
 
     def save_results(self, data, filename):
-        """Save results to JSON file"""
+        """Save results to JSON file (uses orjson when installed)"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
-            self.log(f"\n✓ Results saved to: {filename}")
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=2)
+            self.log("\n✓ Results saved to: %s", filename)
         except Exception as e:
-            self.log(f"\n✗ Error saving results: {e}")
+            self.log("\n✗ Error saving results: %s", e)
 
 
 def main():
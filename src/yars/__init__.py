@@ -0,0 +1,10 @@
+import logging
+
+# YARS logs to YARS.log through its own package logger rather than the root
+# logger, so applications embedding it keep control of console output
+_handler = logging.FileHandler("YARS.log", delay=True)
+_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
+logging.getLogger(__name__).addHandler(_handler)
+logging.getLogger(__name__).setLevel(logging.INFO)
@@ -6,9 +6,7 @@ import requests
 from urllib.parse import urlparse
 from pygments import formatters, highlight, lexers
 
-logging.basicConfig(
-    level=logging.INFO, filename="YARS.log", format="%(asctime)s - %(message)s"
-)
+logger = logging.getLogger(__name__)
 
 
 def display_results(results, title):
@@ -35,14 +33,14 @@ def display_results(results, title):
             )
             print(colorful_json)
         else:
-            logging.warning(
+            logger.warning(
                 "No results to display: expected a list or dictionary, got %S",
                 type(results),
             )
             print("No results to display.")
 
     except Exception as e:
-        logging.error(f"Error displaying results: {e}")
+        logger.error(f"Error displaying results: {e}")
         print("Error displaying results.")
 
 
@@ -62,13 +60,13 @@ def download_image(image_url, output_folder="images", session=None):
         with open(filepath, "wb") as f:
             for chunk in response.iter_content(8192):
                 f.write(chunk)
-        logging.info("Downloaded: %s", filepath)
+        logger.info("Downloaded: %s", filepath)
         return filepath
     except requests.RequestException as e:
-        logging.error("Failed to download %s: %s", image_url, e)
+        logger.error("Failed to download %s: %s", image_url, e)
         return None
     except Exception as e:
-        logging.error("An error occurred while saving the image: %s", e)
+        logger.error("An error occurred while saving the image: %s", e)
         return None
 
 
@@ -7,17 +7,32 @@ import requests
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 
-logger = logging.basicConfig(
-    filename="YARS.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class YARS:
     __slots__ = ("headers", "session", "proxy", "timeout")
 
-    def __init__(self, proxy=None, timeout=10, random_user_agent=True):
+    def __init__(
+        self,
+        proxy=None,
+        timeout=10,
+        random_user_agent=True,
+        pool_connections=10,
+        pool_maxsize=10,
+    ):
         self.session = RandomUserAgentSession() if random_user_agent else requests.Session()
         self.proxy = proxy
         self.timeout = timeout
@@ -28,7 +43,15 @@ class YARS:
             status_forcelist=[429, 500, 502, 503, 504],
         )
 
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        # One pooled adapter shared by every call keeps connections alive;
+        # pool_maxsize should cover the number of concurrent requests
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         if proxy:
             self.session.proxies.update({"http": proxy, "https": proxy})
@@ -41,14 +64,14 @@ class YARS:
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            logging.info("Search request successful")
+            logger.info("Search request successful")
         except Exception as e:
             if response.status_code != 200:
-                logging.info("Search request unsuccessful due to: %s", e)
+                logger.info("Search request unsuccessful due to: %s", e)
                 print(f"Failed to fetch search results: {response.status_code}")
                 return []
 
-        data = response.json()
+        data = _parse_json(response)
         results = []
         for post in data["data"]["children"]:
             post_data = post["data"]
@@ -57,9 +80,14 @@ class YARS:
                     "title": post_data["title"],
                     "link": f"https://www.reddit.com{post_data['permalink']}",
                     "description": post_data.get("selftext", "")[:269],
+                    "permalink": post_data["permalink"],
+                    "subreddit": post_data["subreddit"],
+                    "score": post_data["score"],
+                    "num_comments": post_data["num_comments"],
+                    "created_utc": post_data["created_utc"],
                 }
             )
-        logging.info("Search Results Retrned %d Results", len(results))
+        logger.info("Search Results Retrned %d Results", len(results))
         return results
     def search_reddit(self, query, limit=10, after=None, before=None):
         url = "https://www.reddit.com/search.json"
@@ -76,16 +104,16 @@ class YARS:
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            logging.info("Post details request successful : %s", url)
+            logger.info("Post details request successful : %s", url)
         except Exception as e:
-            logging.info("Post details request unsccessful: %e", e)
+            logger.info("Post details request unsccessful: %e", e)
             if response.status_code != 200:
                 print(f"Failed to fetch post data: {response.status_code}")
                 return None
 
-        post_data = response.json()
+        post_data = _parse_json(response)
         if not isinstance(post_data, list) or len(post_data) < 2:
-            logging.info("Unexpected post data structre")
+            logger.info("Unexpected post data structre")
             print("Unexpected post data structure")
             return None
 
@@ -94,11 +122,11 @@ class YARS:
         body = main_post.get("selftext", "")
 
         comments = self._extract_comments(post_data[1]["data"]["children"])
-        logging.info("Successfully scraped post: %s", title)
+        logger.info("Successfully scraped post: %s", title)
         return {"title": title, "body": body, "comments": comments}
 
     def _extract_comments(self, comments):
-        logging.info("Extracting comments")
+        logger.info("Extracting comments")
         extracted_comments = []
         for comment in comments:
             if isinstance(comment, dict) and comment.get("kind") == "t1":
@@ -116,11 +144,11 @@ class YARS:
                         replies.get("data", {}).get("children", [])
                     )
                 extracted_comments.append(extracted_comment)
-        logging.info("Successfully extracted comments")
+        logger.info("Successfully extracted comments")
         return extracted_comments
 
     def scrape_user_data(self, username, limit=10):
-        logging.info("Scraping user data for %s, limit: %d", username, limit)
+        logger.info("Scraping user data for %s, limit: %d", username, limit)
         base_url = f"https://www.reddit.com/user/{username}/.json"
         params = {"limit": limit, "after": None}
         all_items = []
@@ -132,16 +160,16 @@ class YARS:
                     base_url, params=params, timeout=self.timeout
                 )
                 response.raise_for_status()
-                logging.info("User data request successful")
+                logger.info("User data request successful")
             except Exception as e:
-                logging.info("User data request unsuccessful: %s", e)
+                logger.info("User data request unsuccessful: %s", e)
                 if response.status_code != 200:
                     print(
                         f"Failed to fetch data for user {username}: {response.status_code}"
                     )
                     break
             try:
-                data = response.json()
+                data = _parse_json(response)
             except ValueError:
                 print(f"Failed to parse JSON response for user {username}.")
                 break
@@ -150,13 +178,13 @@ class YARS:
                 print(
                     f"No 'data' or 'children' field found in response for user {username}."
                 )
-                logging.info("No 'data' or 'children' field found in response")
+                logger.info("No 'data' or 'children' field found in response")
                 break
 
             items = data["data"]["children"]
             if not items:
                 print(f"No more items found for user {username}.")
-                logging.info("No more items found for user")
+                logger.info("No more items found for user")
                 break
 
             for item in items:
@@ -195,15 +223,15 @@ class YARS:
                 break
 
             time.sleep(random.uniform(1, 2))
-            logging.info("Sleeping for random time")
+            logger.info("Sleeping for random time")
 
-        logging.info("Successfully scraped user data for %s", username)
+        logger.info("Successfully scraped user data for %s", username)
         return all_items
 
     def fetch_subreddit_posts(
         self, subreddit, limit=10, category="hot", time_filter="all"
     ):
-        logging.info(
+        logger.info(
             "Fetching subreddit/user posts for %s, limit: %d, category: %s, time_filter: %s",
             subreddit,
             limit,
@@ -241,16 +269,16 @@ class YARS:
             try:
                 response = self.session.get(url, params=params, timeout=self.timeout)
                 response.raise_for_status()
-                logging.info("Subreddit/user posts request successful")
+                logger.info("Subreddit/user posts request successful")
             except Exception as e:
-                logging.info("Subreddit/user posts request unsuccessful: %s", e)
+                logger.info("Subreddit/user posts request unsuccessful: %s", e)
                 if response.status_code != 200:
                     print(
                         f"Failed to fetch posts for subreddit/user {subreddit}: {response.status_code}"
                     )
                     break
 
-            data = response.json()
+            data = _parse_json(response)
             posts = data["data"]["children"]
             if not posts:
                 break
@@ -260,6 +288,7 @@ class YARS:
                 post_info = {
                     "title": post_data["title"],
                     "author": post_data["author"],
+                    "subreddit": post_data["subreddit"],
                     "permalink": post_data["permalink"],
                     "score": post_data["score"],
                     "num_comments": post_data["num_comments"],
@@ -284,7 +313,7 @@ class YARS:
                 break
 
             time.sleep(random.uniform(1, 2))
-            logging.info("Sleeping for random time")
+            logger.info("Sleeping for random time")
 
-        logging.info("Successfully fetched subreddit posts for %s", subreddit)
+        logger.info("Successfully fetched subreddit posts for %s", subreddit)
         return all_posts